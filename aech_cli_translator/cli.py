@@ -0,0 +1,778 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import typer
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+    from pydantic_ai.models import Model
+
+# Define logger
+logger = logging.getLogger("aech_cli_translator")
+
+def setup_logging(verbose: bool = False):
+    """Configure logging to stderr: RichHandler on a terminal, plain lines otherwise.
+
+    Automations capture the output, where colors are useless, so rich is
+    not even imported unless stderr is a TTY.
+    """
+    level = logging.DEBUG if verbose else logging.INFO
+    if not sys.stderr.isatty():
+        logging.basicConfig(
+            level=level,
+            format="[%(asctime)s] %(levelname)s %(message)s",
+            datefmt="%X",
+            stream=sys.stderr,
+        )
+        return
+
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(console=Console(stderr=True), rich_tracebacks=True, markup=True)]
+    )
+
+
+app = typer.Typer(no_args_is_help=True, add_completion=False)
+
+@app.callback(invoke_without_command=False)
+def main() -> None:
+    """Aech CLI Translator root command."""
+
+
+TRANSLATOR_INSTRUCTIONS = (
+    "You are an expert enterprise translator. "
+    "Translate the content accurately, preserving formatting (Markdown). "
+    "Use the provided Enterprise Context to ensure correct terminology. "
+    "Do not add conversational filler. Output ONLY the translated markdown."
+)
+
+BACK_TRANSLATOR_INSTRUCTIONS = (
+    "You are an expert translator. "
+    "Translate the text back to the original language (English/Source). "
+    "Output ONLY the translated markdown."
+)
+
+AUDITOR_INSTRUCTIONS = (
+    "You are a Translation Quality Assurance Auditor. "
+    "Compare the Original Text and the Back-Translated Text. "
+    "Identify any significant discrepancies in meaning, tone, or terminology. "
+    "Ignore minor phrasing differences if the meaning is preserved. "
+    "Report the Overall Quality Assessment (Pass/Fail/Needs Review), "
+    "the Key Discrepancies (if any), and Recommendations."
+)
+
+# Prompt templates, formatted once per request. The enterprise context and the
+# auditor's original text go into per-run instructions (the cacheable prefix).
+CONTEXT_TPL = "Enterprise Context:\n{context_text}"
+TRANSLATION_TPL = "Target Language: {target_lang}\n\nContent to Translate:\n{source_text}"
+BACK_TRANSLATION_TPL = (
+    "Translate the following {target_lang} text back to the original language:\n{translated_text}"
+)
+AUDIT_SOURCE_TPL = "Original Text:\n{source_text}"
+AUDIT_TPL = "Back-Translated Text:\n{back_translated_text}"
+
+
+def _prompt_cache_settings(name: str) -> dict:
+    """Provider-side prompt caching for the stable instructions prefix.
+
+    OpenAI caches prefixes automatically; the cache key keeps requests from the
+    same agent on the same cache shard.
+    """
+    return {"openai_prompt_cache_key": f"aech-cli-translator:{name}"}
+
+
+@functools.lru_cache(maxsize=1)
+def _model() -> "Model":
+    """GPT-4.1 with the OpenAI SDK's own retries turned off.
+
+    ``_run_agent`` already retries transient errors with backoff; leaving the
+    SDK's two retries on as well would multiply every attempt by three.
+    """
+    from pydantic_ai.models.openai import OpenAIResponsesModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+
+    client = OpenAIProvider().client.with_options(max_retries=0)
+    return OpenAIResponsesModel('gpt-4.1', provider=OpenAIProvider(openai_client=client))
+
+
+# Define Agents (using instructions per pydantic-ai best practices). Each one is
+# built on first use only and then shared, with its HTTP client, for the rest
+# of the process (batch runs and the daemon).
+@functools.lru_cache(maxsize=1)
+def _translator_agent() -> "Agent":
+    from pydantic_ai import Agent
+
+    return Agent(
+        _model(),
+        instructions=TRANSLATOR_INSTRUCTIONS,
+        model_settings=_prompt_cache_settings("translator"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _back_translator_agent() -> "Agent":
+    from pydantic_ai import Agent
+
+    return Agent(
+        _model(),
+        instructions=BACK_TRANSLATOR_INSTRUCTIONS,
+        model_settings=_prompt_cache_settings("back-translator"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _auditor_agent() -> "Agent":
+    from pydantic_ai import Agent
+
+    from aech_cli_translator.report import AuditReport
+
+    return Agent(
+        _model(),
+        output_type=AuditReport,
+        instructions=AUDITOR_INSTRUCTIONS,
+        model_settings=_prompt_cache_settings("auditor"),
+    )
+
+# On-disk LLM response cache. Disable with AECH_CACHE=0; entries older than
+# AECH_CACHE_TTL seconds are deleted when looked up (no expiry when unset).
+CACHE_DIR = Path.home() / ".cache" / "aech-cli-translator"
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_enabled() -> bool:
+    return os.environ.get("AECH_CACHE", "1") != "0"
+
+
+def _cache_ttl() -> Optional[float]:
+    ttl = os.environ.get("AECH_CACHE_TTL")
+    return float(ttl) if ttl else None
+
+
+def _cache_load(cache_file: Path, ttl: Optional[float]) -> Optional[str]:
+    """Return a cached entry, deleting it instead when it is older than ``ttl``."""
+    try:
+        mtime = cache_file.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if ttl is not None and time.time() - mtime >= ttl:
+        cache_file.unlink(missing_ok=True)
+        return None
+    return cache_file.read_text(encoding="utf-8")
+
+
+def _cache_store(cache_file: Path, text: str) -> None:
+    # A unique temp file per store: identical chunks (or files) can miss and
+    # store the same key concurrently from different worker threads.
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _cache_key(agent: "Agent", instructions: str, prompt: str) -> str:
+    model = agent.model
+    model_id = model if isinstance(model, str) else f"{model.system}:{model.model_name}"
+    return hashlib.sha256(f"{model_id}|{instructions}|{prompt}".encode()).hexdigest()
+
+
+# Transient provider failures (rate limits, 5xx, dropped connections) are
+# retried with exponential backoff: 1s, 2s, 4s, ... capped at 30s, 5 attempts.
+# This is the only retry layer; the SDK's own retries are disabled in _model().
+RETRY_ATTEMPTS = 5
+STREAM_PROGRESS_CHARS = 2000
+
+
+def _is_transient(exc: BaseException) -> bool:
+    from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
+
+    if isinstance(exc, ModelHTTPError):
+        return exc.status_code in (408, 409, 429) or exc.status_code >= 500
+    return isinstance(exc, ModelAPIError)
+
+
+async def _stream_text(agent: "Agent", prompt: str, run_instructions: Optional[str]) -> str:
+    parts: List[str] = []
+    received = reported = 0
+    async with agent.run_stream(prompt, instructions=run_instructions) as stream:
+        async for delta in stream.stream_text(delta=True):
+            parts.append(delta)
+            received += len(delta)
+            if received - reported >= STREAM_PROGRESS_CHARS:
+                logger.debug(f"Received {received} characters...")
+                reported = received
+    return "".join(parts)
+
+
+async def _run_agent(agent: "Agent", prompt: str, run_instructions: Optional[str]) -> Any:
+    """Call the model, streaming text outputs and retrying transient errors."""
+    from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+    retrying = AsyncRetrying(
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        retry=retry_if_exception(_is_transient),
+        before_sleep=lambda state: logger.warning(
+            f"Model request failed ({state.outcome.exception()}), retrying "
+            f"(attempt {state.attempt_number + 1}/{RETRY_ATTEMPTS})..."
+        ),
+        reraise=True,
+    )
+    async for attempt in retrying:
+        with attempt:
+            if agent.output_type is str:
+                return await _stream_text(agent, prompt, run_instructions)
+            result = await agent.run(prompt, instructions=run_instructions)
+            return result.output
+
+
+async def cached_run(
+    agent: "Agent",
+    instructions: str,
+    prompt: str,
+    run_instructions: Optional[str] = None,
+    content_key: Optional[Tuple[str, str]] = None,
+) -> Any:
+    """Run the agent, reusing a previous response for an identical request.
+
+    ``run_instructions`` are appended to the agent's own instructions for this
+    run only, keeping per-run content such as the enterprise context in the
+    cacheable prefix ahead of the user prompt. Structured outputs are cached
+    as JSON and validated back into the agent's output type on a hit.
+
+    ``content_key`` is an optional ``(namespace, text)`` pair. The entry is
+    then keyed on the hash of ``text`` alone under ``CACHE_DIR/namespace``
+    instead of on the full request, so it still hits when the prompt wording
+    or instructions change.
+    """
+    if run_instructions:
+        instructions = f"{instructions}\n\n{run_instructions}"
+    if not _cache_enabled():
+        return await _run_agent(agent, prompt, run_instructions)
+
+    if content_key:
+        namespace, key_text = content_key
+        key = hashlib.sha256(key_text.encode()).hexdigest()
+        cache_file = CACHE_DIR / namespace / f"{key}.txt"
+    else:
+        key = _cache_key(agent, instructions, prompt)
+        cache_file = CACHE_DIR / key[:2] / f"{key}.txt"
+    cached = await asyncio.to_thread(_cache_load, cache_file, _cache_ttl())
+    if cached is not None:
+        cache_stats["hits"] += 1
+        logger.debug(f"LLM cache hit: {key}")
+        return cached if agent.output_type is str else agent.output_type.model_validate_json(cached)
+
+    cache_stats["misses"] += 1
+    output = await _run_agent(agent, prompt, run_instructions)
+    await asyncio.to_thread(
+        _cache_store, cache_file, output if isinstance(output, str) else output.model_dump_json()
+    )
+    return output
+
+def read_markdown(path: Path) -> str:
+    """Read a UTF-8 file in a single unbuffered read."""
+    with path.open("rb", buffering=0) as f:
+        return f.read().decode("utf-8")
+
+
+def write_markdown(path: Path, text: str) -> None:
+    """Write UTF-8 text with one raw open and unbuffered write(s)."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def ensure_dir(path: Path) -> None:
+    # Output directories usually exist already on repeat runs; skip mkdir then.
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
+# Long documents are split into chunks that are translated in parallel.
+CHUNK_MAX_TOKENS = 3000
+CHARS_PER_TOKEN = 4  # rough estimate, good enough for sizing chunks
+
+_HEADING_RE = re.compile(r"#{1,6} ")
+_FENCE_RE = re.compile(r" {0,3}(```|~~~)")
+
+
+def _markdown_blocks(text: str) -> Iterator[Tuple[bool, str]]:
+    """Yield ``(starts_with_heading, block)`` pairs covering ``text``.
+
+    Blocks end at blank lines and before headings, never inside a fenced code
+    block, so a ``#`` comment in a code sample does not start a new section.
+    """
+    block: List[str] = []
+    block_is_heading = False
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if not in_fence and _HEADING_RE.match(line) and block:
+            yield block_is_heading, "".join(block)
+            block = []
+        if not block:
+            block_is_heading = not in_fence and bool(_HEADING_RE.match(line))
+        block.append(line)
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and not line.strip():
+            yield block_is_heading, "".join(block)
+            block = []
+    if block:
+        yield block_is_heading, "".join(block)
+
+
+def _split_markdown(text: str, max_tokens: int = CHUNK_MAX_TOKENS) -> List[str]:
+    """Split Markdown into chunks of about ``max_tokens`` that join back to ``text``.
+
+    Chunks break at headings where possible; a section that is too large on
+    its own is broken at paragraph boundaries instead.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    sections: List[List[str]] = []
+    for is_heading, block in _markdown_blocks(text):
+        if is_heading or not sections:
+            sections.append([block])
+        else:
+            sections[-1].append(block)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for section in sections:
+        section_text = "".join(section)
+        pieces = [section_text] if len(section_text) <= max_chars else section
+        for piece in pieces:
+            if current and current_len + len(piece) > max_chars:
+                chunks.append("".join(current))
+                current, current_len = [], 0
+            current.append(piece)
+            current_len += len(piece)
+    if current:
+        chunks.append("".join(current))
+    return chunks or [text]
+
+
+def _join_chunks(source_chunks: List[str], outputs: List[str]) -> str:
+    """Reassemble per-chunk outputs, restoring each source chunk's trailing whitespace."""
+    if len(outputs) == 1:
+        return outputs[0]
+    return "".join(
+        output.rstrip() + chunk[len(chunk.rstrip()):]
+        for chunk, output in zip(source_chunks, outputs)
+    )
+
+
+async def _gather_bounded(coros: Iterable[Awaitable[str]], request_limit: asyncio.Semaphore) -> List[str]:
+    async def bounded(coro: Awaitable[str]) -> str:
+        async with request_limit:
+            return await coro
+
+    return await asyncio.gather(*(bounded(c) for c in coros))
+
+
+async def run_translation_flow(
+    input_path: Path,
+    target_lang: str,
+    context_text: str,
+    out_path: Path,
+    request_limit: asyncio.Semaphore,
+    chunk: bool = True,
+) -> dict:
+    """Translate, back-translate and audit one file.
+
+    ``request_limit`` caps the model requests in flight. It is shared by every
+    file of a batch (and every daemon request), so ``--concurrency`` bounds the
+    total load on the provider, not a per-file chunk fan-out.
+    """
+    from aech_cli_translator.report import render_report
+
+    source_text = await asyncio.to_thread(read_markdown, input_path)
+
+    # 1. Translate
+    logger.info(f"Translating {input_path.name} to {target_lang}...")
+    logger.debug(f"Reading input file: {input_path}")
+
+    
+    # The enterprise context is stable across runs, so it goes into the
+    # instructions (cacheable prefix) rather than the user prompt. Without a
+    # context file the block is left out entirely instead of sent empty.
+    context_instructions = CONTEXT_TPL.format(context_text=context_text) if context_text.strip() else None
+
+    chunks = _split_markdown(source_text) if chunk else [source_text]
+    translation_prompts = [
+        TRANSLATION_TPL.format(target_lang=target_lang, source_text=source_chunk)
+        for source_chunk in chunks
+    ]
+    
+    logger.debug(f"Sending translation request to LLM ({len(chunks)} chunk(s))...")
+    translated_chunks = await _gather_bounded(
+        (
+            cached_run(_translator_agent(), TRANSLATOR_INSTRUCTIONS, prompt, context_instructions)
+            for prompt in translation_prompts
+        ),
+        request_limit,
+    )
+    translated_text = _join_chunks(chunks, translated_chunks)
+    logger.debug("Received translation response.")
+    
+    # Save translation (the write overlaps with the back-translation request)
+    translated_filename = f"{input_path.stem}_{target_lang}.md"
+    translated_file = out_path / translated_filename
+    write_task = asyncio.to_thread(write_markdown, translated_file, translated_text)
+
+    # 2. Back-Translate
+    logger.info(f"Back-translating for verification...")
+
+    back_translation_prompts = [
+        BACK_TRANSLATION_TPL.format(target_lang=target_lang, translated_text=translated_chunk)
+        for translated_chunk in translated_chunks
+    ]
+    
+    logger.debug("Sending back-translation request to LLM...")
+    _, back_translated_chunks = await asyncio.gather(
+        write_task,
+        _gather_bounded(
+            (
+                # Keyed on the translated text itself so retries reuse it even
+                # if the prompt changes.
+                cached_run(
+                    _back_translator_agent(), BACK_TRANSLATOR_INSTRUCTIONS, prompt,
+                    content_key=("bt", translated_chunk),
+                )
+                for prompt, translated_chunk in zip(back_translation_prompts, translated_chunks)
+            ),
+            request_limit,
+        ),
+    )
+    back_translated_text = _join_chunks(chunks, back_translated_chunks)
+    logger.info(f"Translation saved to {translated_file}")
+    logger.debug("Received back-translation response.")
+
+    # 3. Verify / Generate Report
+    logger.info(f"Generating Quality Report...")
+
+    # The original text goes into the instructions so it sits in the
+    # cacheable prefix; only the back-translation varies between audits.
+    source_instructions = AUDIT_SOURCE_TPL.format(source_text=source_text)
+    report_prompt = AUDIT_TPL.format(back_translated_text=back_translated_text)
+    
+    logger.debug("Sending audit request to LLM...")
+    async with request_limit:
+        report = await cached_run(
+            _auditor_agent(), AUDITOR_INSTRUCTIONS, report_prompt, source_instructions,
+            content_key=("report", "\0".join([source_text, back_translated_text])),
+        )
+    logger.debug("Received audit response.")
+    
+    # Save report
+    report_text = render_report(report)
+    report_filename = f"{input_path.stem}_translation_report.md"
+    report_file = out_path / report_filename
+    await asyncio.to_thread(write_markdown, report_file, report_text)
+    logger.info(f"Report saved to {report_file}")
+
+    return {
+        "translated_file": str(translated_file),
+        "report_file": str(report_file),
+        "overall_assessment": report.overall,
+    }
+
+
+def resolve_input_paths(input_files: List[str]) -> List[Path]:
+    """Expand directories to the Markdown files they contain."""
+    input_paths = []
+    for input_file in input_files:
+        path = Path(input_file)
+        if path.is_dir():
+            input_paths.extend(sorted(path.glob("*.md")))
+        else:
+            input_paths.append(path)
+    return input_paths
+
+
+def resolve_context_path(context_file: Optional[str]) -> Optional[Path]:
+    """Return the context file path, or None (with a warning) when it is missing."""
+    if not context_file:
+        return None
+    ctx_path = Path(context_file)
+    if not ctx_path.exists():
+        logger.warning(f"Context file {context_file} not found. Proceeding without context.")
+        return None
+    return ctx_path
+
+
+def load_context(context_file: Optional[str]) -> str:
+    ctx_path = resolve_context_path(context_file)
+    return read_markdown(ctx_path) if ctx_path else ""
+
+
+async def run_batch(
+    input_paths: List[Path], translate_one: Callable[[Path], Awaitable[dict]], concurrency: int
+) -> int:
+    """Translate several files concurrently. Returns the number of failed files."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(input_path: Path) -> None:
+        async with semaphore:
+            print(json.dumps(await translate_one(input_path)))
+
+    results = await asyncio.gather(*(bounded(p) for p in input_paths), return_exceptions=True)
+
+    failures = 0
+    for input_path, result in zip(input_paths, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Error translating {input_path}: {result}", exc_info=result)
+            failures += 1
+    return failures
+
+
+# Daemon mode: one long-lived process keeps the agents (and their HTTP clients)
+# warm and serves newline-delimited JSON requests over a Unix socket. The
+# translate command forwards to it when AECH_DAEMON_SOCK is set.
+DAEMON_SOCKET_ENV = "AECH_DAEMON_SOCK"
+DEFAULT_DAEMON_SOCKET = "/tmp/aech-cli-translator.sock"
+
+
+async def handle_daemon_request(request: dict, request_limit: asyncio.Semaphore) -> dict:
+    out_path = Path(request["output_dir"])
+    ensure_dir(out_path)
+    context_text = await asyncio.to_thread(load_context, request.get("context_file"))
+    return await run_translation_flow(
+        Path(request["input_file"]), request["target_lang"], context_text, out_path,
+        request_limit, request.get("chunk", True),
+    )
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request_limit: asyncio.Semaphore
+) -> None:
+    try:
+        while line := await reader.readline():
+            try:
+                response = await handle_daemon_request(json.loads(line), request_limit)
+            except Exception as e:
+                logger.exception(f"Error handling daemon request: {e}")
+                response = {"error": str(e)}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def _daemon_alive(socket_path: Path) -> bool:
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    writer.close()
+    return True
+
+
+async def serve_forever(socket_path: Path, concurrency: int) -> None:
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{socket_path} exists and is not a socket; refusing to replace it.")
+        if await _daemon_alive(socket_path):
+            raise RuntimeError(f"A translation daemon is already listening on {socket_path}.")
+        # A leftover socket file from a dead daemon would make bind() fail.
+        socket_path.unlink()
+    # One limit for all connections: the daemon's total model requests in flight.
+    request_limit = asyncio.Semaphore(concurrency)
+    # Requests make the daemon read and write arbitrary paths as this user, so
+    # the socket is created 0600 under a restrictive umask: there is no window
+    # after bind() in which other users could connect.
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(
+            functools.partial(_serve_connection, request_limit=request_limit), path=str(socket_path)
+        )
+    finally:
+        os.umask(old_umask)
+    logger.info(f"Serving translation requests on {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+async def request_daemon(socket_path: str, request: dict) -> dict:
+    """Send one translate request to the daemon and return its result."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+    finally:
+        writer.close()
+
+    if not line:
+        raise ConnectionError(f"Translation daemon at {socket_path} closed the connection without a response.")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response
+
+def _run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``main`` on uvloop when the optional `fast` extra is installed."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ModuleNotFoundError:
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+@app.command(name="translate")
+def translate(
+    input_files: List[str] = typer.Argument(..., help="Input file paths or directories of .md files"),
+    target_lang: str = typer.Argument(..., help="Target language code"),
+    context_file: Optional[str] = typer.Option(None, "--context", "-c", help="Path to a markdown file containing enterprise context"),
+    output_dir: str = typer.Option(..., "--output-dir", "-o", help="Directory to save output"),
+    concurrency: int = typer.Option(4, "--concurrency", "-j", min=1, help="Maximum number of model requests (and files) in flight at once"),
+    chunk: bool = typer.Option(True, "--chunk/--no-chunk", help="Split long documents at headings and translate the chunks in parallel"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
+):
+    """
+    Translates documents with enterprise context and back-translation verification.
+    """
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file if present
+    load_dotenv()
+    setup_logging(verbose)
+
+    input_paths = resolve_input_paths(input_files)
+    out_path = Path(output_dir)
+    daemon_socket = os.environ.get(DAEMON_SOCKET_ENV)
+    if not daemon_socket:
+        ensure_dir(out_path)
+
+    missing = [str(p) for p in input_paths if not p.exists()]
+    if missing:
+        logger.error(f"Input file not found: {', '.join(missing)}")
+
+        raise typer.Exit(code=1)
+
+    if not input_paths:
+        logger.error("No Markdown files found in the given input directories.")
+
+        raise typer.Exit(code=1)
+
+    # Outputs are named after the input stem, so same-named files from
+    # different directories would overwrite each other's results.
+    paths_by_stem: Dict[str, List[Path]] = {}
+    for input_path in input_paths:
+        paths_by_stem.setdefault(input_path.stem, []).append(input_path)
+    clashes = [paths for paths in paths_by_stem.values() if len(paths) > 1]
+    if clashes:
+        listed = "; ".join(", ".join(str(p) for p in paths) for paths in clashes)
+        logger.error(f"Inputs would write the same output files in {out_path}: {listed}")
+
+        raise typer.Exit(code=1)
+
+    if daemon_socket:
+        # The daemon runs with its own working directory, so send absolute paths.
+        ctx_path = resolve_context_path(context_file)
+
+        def translate_one(input_path: Path) -> Awaitable[dict]:
+            return request_daemon(daemon_socket, {
+                "input_file": str(input_path.resolve()),
+                "target_lang": target_lang,
+                "context_file": str(ctx_path.resolve()) if ctx_path else None,
+                "output_dir": str(out_path.resolve()),
+                "chunk": chunk,
+            })
+
+        batch = run_batch(input_paths, translate_one, concurrency)
+    else:
+        async def translate_local() -> int:
+            # Load context if provided, while the translator agent (and
+            # pydantic-ai itself) is built on another thread.
+            context_text, _ = await asyncio.gather(
+                asyncio.to_thread(load_context, context_file),
+                asyncio.to_thread(_translator_agent),
+            )
+
+            request_limit = asyncio.Semaphore(concurrency)
+
+            def translate_one(input_path: Path) -> Awaitable[dict]:
+                return run_translation_flow(input_path, target_lang, context_text, out_path, request_limit, chunk)
+
+            return await run_batch(input_paths, translate_one, concurrency)
+
+        batch = translate_local()
+
+    # Run async flow
+    try:
+        failures = _run_async(batch)
+    except Exception as e:
+        logger.exception(f"Error during translation flow: {e}")
+
+        raise typer.Exit(code=1)
+    finally:
+        if _cache_enabled() and not daemon_socket:
+            logger.info(f"LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@app.command(name="serve")
+def serve(
+    socket_path: str = typer.Option(DEFAULT_DAEMON_SOCKET, "--socket", "-s", help="Unix socket path to listen on"),
+    concurrency: int = typer.Option(4, "--concurrency", "-j", min=1, help="Maximum number of model requests in flight across all clients"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
+):
+    """
+    Runs a long-lived translation daemon. Point translate at it with AECH_DAEMON_SOCK.
+    """
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file if present
+    load_dotenv()
+    setup_logging(verbose)
+
+    # Build the agents up front so configuration errors surface at startup.
+    _translator_agent()
+    _back_translator_agent()
+    _auditor_agent()
+
+    try:
+        _run_async(serve_forever(Path(socket_path), concurrency))
+    except KeyboardInterrupt:
+        logger.info("Translation daemon stopped.")
+    except RuntimeError as e:
+        logger.error(str(e))
+
+        raise typer.Exit(code=1)
@@ -0,0 +1,36 @@
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+
+class AuditReport(BaseModel):
+    """Structured QA verdict returned by the auditor agent."""
+
+    overall: Literal["Pass", "Fail", "Needs Review"] = Field(
+        description="Overall Quality Assessment of the translation."
+    )
+    discrepancies: List[str] = Field(
+        default_factory=list,
+        description="Key discrepancies in meaning, tone, or terminology. Empty if none.",
+    )
+    recommendations: List[str] = Field(
+        default_factory=list,
+        description="What to adjust in the translation. Empty if no changes are needed.",
+    )
+
+
+def _bullets(items: List[str]) -> str:
+    return "\n".join(f"- {item}" for item in items) if items else "None."
+
+
+def render_report(report: AuditReport) -> str:
+    """Render the audit as the Markdown QA report written next to the translation."""
+    return (
+        "# Translation Quality Report\n\n"
+        "## Overall Quality Assessment\n\n"
+        f"{report.overall}\n\n"
+        "## Key Discrepancies\n\n"
+        f"{_bullets(report.discrepancies)}\n\n"
+        "## Recommendations\n\n"
+        f"{_bullets(report.recommendations)}\n"
+    )
@@ -0,0 +1,30 @@
+"""Build hook that precompiles the manifest for the `--help` fast path.
+
+The installed package gets `aech_cli_translator/_manifest_bytes.py` holding the
+already-indented manifest JSON, so emitting it needs no parsing or
+serialization at runtime. Editable installs (`pip install -e .`) import the
+source tree, so there the module is written next to the sources (it is
+gitignored). All other metadata lives in pyproject.toml.
+"""
+import json
+from pathlib import Path
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class build_py_with_manifest(build_py):
+    def run(self):
+        super().run()
+        source_dir = Path(self.get_package_dir("aech_cli_translator"))
+        target_dir = source_dir if self.editable_mode else Path(self.build_lib) / "aech_cli_translator"
+        manifest = json.loads((source_dir / "manifest.json").read_text(encoding="utf-8"))
+        manifest_bytes = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+        (target_dir / "_manifest_bytes.py").write_text(
+            "# Generated by setup.py from manifest.json. Do not edit.\n"
+            f"MANIFEST_BYTES = {manifest_bytes!r}\n",
+            encoding="utf-8",
+        )
+
+
+setup(cmdclass={"build_py": build_py_with_manifest})
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import FunctionModel
+
+from aech_cli_translator import cli
+from aech_cli_translator.report import AuditReport
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "CACHE_DIR", tmp_path)
+    monkeypatch.setenv("AECH_CACHE", "1")
+    monkeypatch.delenv("AECH_CACHE_TTL", raising=False)
+    return tmp_path
+
+
+def _text_agent(calls):
+    async def stream(messages, info):
+        calls.append(messages[-1].parts[-1].content)
+        yield "translated"
+
+    return Agent(FunctionModel(stream_function=stream))
+
+
+def test_content_key_hits_across_prompts(cache_dir):
+    calls = []
+    agent = _text_agent(calls)
+
+    async def run():
+        first = await cli.cached_run(agent, "instr", "prompt one", content_key=("bt", "same text"))
+        second = await cli.cached_run(agent, "other instr", "prompt two", content_key=("bt", "same text"))
+        return first, second
+
+    assert asyncio.run(run()) == ("translated", "translated")
+    assert calls == ["prompt one"]
+    assert len(list((cache_dir / "bt").glob("*.txt"))) == 1
+
+
+def test_audit_report_round_trips_on_hit():
+    calls = []
+    report = AuditReport(overall="Needs Review", discrepancies=["tone"], recommendations=["soften"])
+
+    def audit(messages, info):
+        calls.append(1)
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, report.model_dump())])
+
+    agent = Agent(FunctionModel(audit), output_type=AuditReport)
+
+    async def run():
+        return [await cli.cached_run(agent, "instr", "prompt") for _ in range(2)]
+
+    assert asyncio.run(run()) == [report, report]
+    assert len(calls) == 1
+
+
+def test_expired_entry_is_deleted(cache_dir):
+    cache_file = cache_dir / "ab" / "entry.txt"
+    cli._cache_store(cache_file, "old")
+    assert cli._cache_load(cache_file, ttl=60) == "old"
+
+    stale = time.time() - 120
+    os.utime(cache_file, (stale, stale))
+    assert cli._cache_load(cache_file, ttl=60) is None
+    assert not cache_file.exists()
+    assert cli._cache_load(cache_file, ttl=None) is None
+
+
+def test_concurrent_stores_of_one_key(cache_dir):
+    cache_file = cache_dir / "ab" / "entry.txt"
+    errors = []
+
+    def store(n):
+        for i in range(200):
+            try:
+                cli._cache_store(cache_file, f"{n}-{i}")
+            except Exception as exc:
+                errors.append(exc)
+
+    threads = [threading.Thread(target=store, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert list(cache_file.parent.iterdir()) == [cache_file]
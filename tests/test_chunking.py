@@ -0,0 +1,57 @@
+from aech_cli_translator.cli import CHARS_PER_TOKEN, _join_chunks, _markdown_blocks, _split_markdown
+
+
+DOC = """# Intro
+
+Some opening text.
+
+## Install
+
+```bash
+# not a heading
+pip install aech
+```
+
+## Usage
+
+Run it.
+"""
+
+
+def test_chunks_join_back_to_source():
+    chunks = _split_markdown(DOC, max_tokens=1)
+    assert len(chunks) > 1
+    assert "".join(chunks) == DOC
+    assert _join_chunks(chunks, chunks) == DOC
+
+
+def test_join_restores_trailing_whitespace():
+    chunks = ["# A\n\ntext\n\n", "# B\n\nmore\n"]
+    outputs = ["# X\n\ntexto", "# Y\n\nmás\n\n\n"]
+    assert _join_chunks(chunks, outputs) == "# X\n\ntexto\n\n# Y\n\nmás\n"
+
+
+def test_fenced_hash_does_not_start_section():
+    headings = [block for is_heading, block in _markdown_blocks(DOC) if is_heading]
+    assert headings == ["# Intro\n\n", "## Install\n\n", "## Usage\n\n"]
+
+    # Room for the code-sample section, but not for two sections.
+    install = DOC[DOC.index("## Install"):DOC.index("## Usage")]
+    chunks = _split_markdown(DOC, max_tokens=len(install) // CHARS_PER_TOKEN + 1)
+    assert [chunk.split("\n", 1)[0] for chunk in chunks] == ["# Intro", "## Install", "## Usage"]
+
+
+def test_oversized_section_splits_at_paragraphs():
+    paragraph = "word " * 10
+    doc = "# Only section\n\n" + "\n\n".join([paragraph] * 4) + "\n"
+    chunks = _split_markdown(doc, max_tokens=len(paragraph) // CHARS_PER_TOKEN + 1)
+    assert len(chunks) > 1
+    assert "".join(chunks) == doc
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    assert chunks[0].startswith("# Only section")
+
+
+def test_single_chunk_passes_through():
+    assert _split_markdown(DOC) == [DOC]
+    assert _join_chunks([DOC], ["translated  \n"]) == "translated  \n"
+    assert _split_markdown("") == [""]